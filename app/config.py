@@ -13,6 +13,15 @@ class Settings(BaseSettings):
 
     OLLAMA_PORT: int= 11434
     OLLAMA_MODEL: str = "qwen3:30b-a3b"
+    OLLAMA_FAST_MODEL: str = "qwen3:4b"
+
+    ROUTER_ENABLED: bool = True
+    ROUTER_FAQ_FILE: str = "app/data/faq_queries.txt"
+    ROUTER_MAX_QUERY_CHARS: int = 120
+    ROUTER_FAQ_SIMILARITY: float = 0.85
+    ROUTER_USE_RETRIEVAL_CONFIDENCE: bool = False
+    ROUTER_MIN_TOP_SCORE: float = 0.6
+    ROUTER_MIN_SCORE_MARGIN: float = 0.02
 
     EMBEDDING_MODEL_NAME: str = "sergeyzh/BERTA"
     EMBEDDING_DIM: int = 768
@@ -31,5 +40,8 @@ print(f"Qdrant Port: {settings.QDRANT_PORT}")
 # print(f"vLLM Host: {settings.VLLM_HOST}")
 # print(f"vLLM Port: {settings.VLLM_PORT}")
 # print(f"vLLM Model: {settings.VLLM_MODEL}")
+print(f"Ollama Model: {settings.OLLAMA_MODEL}")
+print(f"Ollama Fast Model: {settings.OLLAMA_FAST_MODEL}")
+print(f"Query Routing Enabled: {settings.ROUTER_ENABLED}")
 print(f"Embedding Model: {settings.EMBEDDING_MODEL_NAME}")
 print(f"Embedding Dim: {settings.EMBEDDING_DIM}")
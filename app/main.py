@@ -13,6 +13,7 @@ import time
 from app.services.document_processor import DocumentProcessor
 from app.services.vector_store import VectorStoreService
 from app.services.chat_engine import ChatEngine
+from app.services.query_router import QueryRouter
 from app.utils.llm_client import LLMClient
 
 logging.basicConfig(
@@ -25,7 +26,8 @@ logger = logging.getLogger(__name__)
 document_processor = DocumentProcessor()
 vector_store = VectorStoreService()
 llm_client = LLMClient()
-chat_engine = ChatEngine(vector_store, document_processor, llm_client)
+query_router = QueryRouter(document_processor)
+chat_engine = ChatEngine(vector_store, document_processor, llm_client, query_router)
 
 app = FastAPI(title="SFN AI Chat Bot")
 
@@ -199,6 +201,11 @@ async def create_session():
     return {"session_id": session_id}
 
 
+@app.get("/api/routing/stats")
+async def routing_stats_endpoint():
+    return query_router.get_stats()
+
+
 @app.get("/health")
 async def health_check():
     return {"status": "ok", "timestamp": datetime.now().isoformat()}
@@ -7,6 +7,7 @@ import asyncio
 from ..utils.llm_client import LLMClient
 from ..services.vector_store import VectorStoreService
 from ..services.document_processor import DocumentProcessor
+from ..services.query_router import QueryRouter, FAST_ROUTE, LARGE_ROUTE
 
 logger = logging.getLogger(__name__)
 
@@ -17,10 +18,12 @@ class ChatEngine:
         vector_store: VectorStoreService,
         document_processor: DocumentProcessor,
         llm_client: LLMClient,
+        query_router: Optional[QueryRouter] = None,
     ):
         self.vector_store = vector_store
         self.document_processor = document_processor
         self.llm_client = llm_client
+        self.query_router = query_router
         self.chat_histories = {}
         self.collection_name = "sfn_knowledge"
 
@@ -37,13 +40,17 @@ class ChatEngine:
         return self.chat_histories[session_id]
 
     async def search_knowledge_base(self, query: str, limit: int = 5) -> List[Dict]:
+        _, search_results = await self._search(query, limit)
+        return [result.payload for result in search_results if result.payload]
+
+    async def _search(self, query: str, limit: int = 5):
         logger.info(f"Searching knowledge base for query: {query[:50]}...")
         query_embedding = await asyncio.to_thread(
             self.document_processor.get_query_embedding, query
         )
         if not query_embedding:
             logger.warning("Failed to generate query embedding.")
-            return []
+            return None, []
 
         search_results = await asyncio.to_thread(
             self.vector_store.search,
@@ -52,7 +59,32 @@ class ChatEngine:
             limit=limit
         )
         logger.info(f"Found {len(search_results)} results from knowledge base.")
-        return [result.payload for result in search_results if result.payload]
+        return query_embedding, search_results
+
+    async def generate_response(self, query: str, prompt: str, query_embedding, scores: List[float]) -> Dict:
+        if self.query_router:
+            decision = self.query_router.route(query, query_embedding, scores)
+            if decision["route"] == FAST_ROUTE:
+                # No retries on the fast route: the large model is the retry.
+                completion = await self.llm_client.get_completion(
+                    prompt, max_retries=0, model_name=decision["model"], think=decision["think"]
+                )
+                self.query_router.record_completion(FAST_ROUTE, completion)
+                if completion:
+                    return {**completion, "route": FAST_ROUTE}
+                self.query_router.record_fallback()
+
+        completion = await self.llm_client.get_completion(prompt)
+        if self.query_router:
+            self.query_router.record_completion(LARGE_ROUTE, completion)
+        if completion:
+            return {**completion, "route": LARGE_ROUTE if self.query_router else None}
+
+        return {
+            "content": "I apologize, but I'm currently unable to generate a response. Please try again later.",
+            "model": None,
+            "route": None,
+        }
 
 
     def generate_prompt(self, query: str, context_chunks: List[Dict]) -> str:
@@ -82,14 +114,23 @@ class ChatEngine:
             session_id = self.create_chat_session()
 
         logger.info(f"Processing query for session {session_id}: {query[:50]}...")
-        context_chunks = await self.search_knowledge_base(query)
+        query_embedding, search_results = await self._search(query)
+        context_chunks = [result.payload for result in search_results if result.payload]
+        scores = [result.score for result in search_results]
         
         prompt = self.generate_prompt(query, context_chunks)
         
-        response_content = await self.llm_client.get_completion(prompt)
+        generation = await self.generate_response(query, prompt, query_embedding, scores)
+        response_content = generation["content"]
         
         user_message = {"role": "user", "content": query, "timestamp": datetime.now().isoformat()}
-        assistant_message = {"role": "assistant", "content": response_content, "timestamp": datetime.now().isoformat()}
+        assistant_message = {
+            "role": "assistant",
+            "content": response_content,
+            "timestamp": datetime.now().isoformat(),
+            "model": generation["model"],
+            "route": generation["route"],
+        }
 
         self.chat_histories[session_id].append(user_message)
         self.chat_histories[session_id].append(assistant_message)
@@ -0,0 +1,150 @@
+import logging
+from typing import List, Dict, Optional
+import numpy as np
+
+from ..config import settings
+from ..services.document_processor import DocumentProcessor
+
+logger = logging.getLogger(__name__)
+
+FAST_ROUTE = "fast"
+LARGE_ROUTE = "large"
+
+
+class QueryRouter:
+    def __init__(self, document_processor: DocumentProcessor):
+        self.enabled = settings.ROUTER_ENABLED
+        self.fast_model = settings.OLLAMA_FAST_MODEL
+        self.large_model = settings.OLLAMA_MODEL
+        self.max_query_chars = settings.ROUTER_MAX_QUERY_CHARS
+        self.faq_similarity = settings.ROUTER_FAQ_SIMILARITY
+        self.use_retrieval_confidence = settings.ROUTER_USE_RETRIEVAL_CONFIDENCE
+        self.min_top_score = settings.ROUTER_MIN_TOP_SCORE
+        self.min_score_margin = settings.ROUTER_MIN_SCORE_MARGIN
+
+        self.stats = {
+            route: {
+                "count": 0,
+                "failures": 0,
+                "total_latency": 0.0,
+                "max_latency": 0.0,
+                "total_queue_wait": 0.0,
+            }
+            for route in (FAST_ROUTE, LARGE_ROUTE)
+        }
+        self.fallbacks = 0
+
+        self.faq_embeddings = None
+        if self.enabled:
+            self.faq_embeddings = self._load_faq_embeddings(document_processor)
+        logger.info(
+            f"Query router enabled={self.enabled}: fast={self.fast_model}, large={self.large_model}"
+        )
+
+    def _load_faq_embeddings(self, document_processor: DocumentProcessor) -> Optional[np.ndarray]:
+        text = document_processor.load_document_text(settings.ROUTER_FAQ_FILE)
+        if not text:
+            logger.warning("No FAQ queries loaded, FAQ fast path disabled.")
+            return None
+
+        faq_queries = [line.strip() for line in text.splitlines() if line.strip()]
+        try:
+            embeddings = document_processor.embedding_model.encode(
+                faq_queries, normalize_embeddings=True
+            )
+            logger.info(f"Loaded {len(faq_queries)} FAQ queries for routing")
+            return np.asarray(embeddings)
+        except Exception as e:
+            logger.error(f"Error embedding FAQ queries: {e}")
+            return None
+
+    def _faq_similarity(self, query_embedding: List[float]) -> float:
+        if self.faq_embeddings is None or not query_embedding:
+            return 0.0
+        query_vector = np.asarray(query_embedding)
+        norm = np.linalg.norm(query_vector)
+        if norm == 0:
+            return 0.0
+        return float(np.max(self.faq_embeddings @ (query_vector / norm)))
+
+    def route(self, query: str, query_embedding: List[float], scores: List[float]) -> Dict:
+        top_score = scores[0] if scores else 0.0
+        score_margin = scores[0] - scores[1] if len(scores) > 1 else top_score
+        faq_similarity = self._faq_similarity(query_embedding)
+        signals = {
+            "query_chars": len(query),
+            "top_score": round(top_score, 4),
+            "score_margin": round(score_margin, 4),
+            "faq_similarity": round(faq_similarity, 4),
+        }
+
+        if not self.enabled:
+            route, reason = LARGE_ROUTE, "routing disabled"
+        elif len(query) > self.max_query_chars:
+            route, reason = LARGE_ROUTE, "long query"
+        elif faq_similarity >= self.faq_similarity:
+            route, reason = FAST_ROUTE, "matches known FAQ"
+        elif (
+            self.use_retrieval_confidence
+            and top_score >= self.min_top_score
+            and score_margin >= self.min_score_margin
+        ):
+            route, reason = FAST_ROUTE, "confident retrieval"
+        else:
+            route, reason = LARGE_ROUTE, "no fast-path match"
+
+        decision = {
+            "route": route,
+            "model": self.fast_model if route == FAST_ROUTE else self.large_model,
+            "think": False if route == FAST_ROUTE else None,
+            "reason": reason,
+            "signals": signals,
+        }
+        logger.info(
+            f"Routed query to {route} ({decision['model']}): {reason}, signals={signals}"
+        )
+        return decision
+
+    def record_completion(self, route: str, completion: Optional[Dict]):
+        route_stats = self.stats[route]
+        if completion is None:
+            route_stats["failures"] += 1
+            logger.warning(f"Generation on {route} route failed")
+            return
+
+        route_stats["count"] += 1
+        route_stats["total_latency"] += completion["latency"]
+        route_stats["max_latency"] = max(route_stats["max_latency"], completion["latency"])
+        route_stats["total_queue_wait"] += completion["queue_wait"]
+        logger.info(
+            f"Generation on {route} route took {completion['latency']:.2f}s "
+            f"(queued {completion['queue_wait']:.2f}s)"
+        )
+
+    def record_fallback(self):
+        self.fallbacks += 1
+        logger.warning(f"Fast route failed, falling back to {self.large_model}")
+
+    def get_stats(self) -> Dict:
+        attempts_total = sum(
+            route_stats["count"] + route_stats["failures"] for route_stats in self.stats.values()
+        )
+        routes = {}
+        for route, route_stats in self.stats.items():
+            count = route_stats["count"]
+            attempts = count + route_stats["failures"]
+            routes[route] = {
+                "model": self.fast_model if route == FAST_ROUTE else self.large_model,
+                "count": count,
+                "failures": route_stats["failures"],
+                "share": round(attempts / attempts_total, 4) if attempts_total else 0.0,
+                "avg_latency": round(route_stats["total_latency"] / count, 4) if count else 0.0,
+                "max_latency": round(route_stats["max_latency"], 4),
+                "avg_queue_wait": round(route_stats["total_queue_wait"] / count, 4) if count else 0.0,
+            }
+        return {
+            "enabled": self.enabled,
+            "attempts": attempts_total,
+            "fallbacks": self.fallbacks,
+            "routes": routes,
+        }
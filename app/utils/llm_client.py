@@ -3,6 +3,7 @@ import httpx
 import json
 from ..config import settings
 import asyncio
+import time
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -17,10 +18,13 @@ class LLMClient:
         self.model_name = settings.OLLAMA_MODEL
         self.timeout = 900
 
-    async def get_completion(self, prompt, max_retries=3):
+    async def get_completion(self, prompt, max_retries=3, model_name=None, think=None):
+        model_name = model_name or self.model_name
+        queued_at = time.perf_counter()
         async with ollama_lock:
+            queue_wait = time.perf_counter() - queued_at
             payload = {
-                "model": self.model_name,
+                "model": model_name,
                 "messages": [{"role": "user", "content": prompt}],
                 "stream": False,
                 "options": {
@@ -29,15 +33,19 @@ class LLMClient:
                     "num_predict": 1024,
                 }
             }
+            if think is not None:
+                payload["think"] = think
 
             async with httpx.AsyncClient(timeout=self.timeout) as client:
                 for attempt in range(max_retries + 1):
                     try:
                         logger.info(
-                            f"Sending prompt to Ollama (attempt {attempt + 1}/{max_retries + 1})"
+                            f"Sending prompt to Ollama model {model_name} (attempt {attempt + 1}/{max_retries + 1})"
                         )
 
+                        started_at = time.perf_counter()
                         response = await client.post(self.api_chat_url, json=payload)
+                        latency = time.perf_counter() - started_at
                         response.raise_for_status()
 
                         try:
@@ -54,7 +62,12 @@ class LLMClient:
                                     final_content = raw_content.strip()
 
                                 logger.info(f"Parsed content: {final_content}")
-                                return final_content
+                                return {
+                                    "content": final_content,
+                                    "model": model_name,
+                                    "latency": latency,
+                                    "queue_wait": queue_wait,
+                                }
                             else:
                                 logger.warning(
                                     "Ollama response missing 'message' or 'content' field."
@@ -76,6 +89,6 @@ class LLMClient:
                         logger.info(f"Retrying in {sleep_time} seconds...")
                         await asyncio.sleep(sleep_time)
 
-            logger.error("All Ollama attempts failed after multiple retries.")
-            return "I apologize, but I'm currently unable to generate a response. Please try again later."
+            logger.error(f"All Ollama attempts for model {model_name} failed.")
+            return None
 